@@ -1,6 +1,7 @@
 import logging
 import os
 import pathlib
+import shutil
 import stat
 import subprocess
 import threading
@@ -24,27 +25,31 @@ class ElixirTools(SolidLanguageServer):
     Provides Elixir specific instantiation of the LanguageServer class using Next LS from elixir-tools.
     """
 
+    # For Elixir projects, we should ignore:
+    # - _build: compiled artifacts
+    # - deps: dependencies
+    # - node_modules: if the project has JavaScript components
+    # - .elixir_ls: ElixirLS artifacts (in case both are present)
+    # - cover: coverage reports
+    _IGNORED_DIRNAMES = frozenset({"_build", "deps", "node_modules", ".elixir_ls", "cover"})
+
+    # Maps the path of an Elixir executable to its (successfully determined) version
+    _elixir_version_cache: dict[str, str] = {}
+
+    _NEXT_LS_INTERNAL_PATH_PATTERNS = (
+        ".burrito",  # Next LS runtime directory
+        "next_ls_erts-",  # Next LS Erlang runtime
+        "_next_ls_private_",  # Next LS private files
+        "/priv/monkey/",  # Next LS monkey patching directory
+    )
+
     @override
     def is_ignored_dirname(self, dirname: str) -> bool:
-        # For Elixir projects, we should ignore:
-        # - _build: compiled artifacts
-        # - deps: dependencies
-        # - node_modules: if the project has JavaScript components
-        # - .elixir_ls: ElixirLS artifacts (in case both are present)
-        # - cover: coverage reports
-        return super().is_ignored_dirname(dirname) or dirname in ["_build", "deps", "node_modules", ".elixir_ls", "cover"]
+        return dirname in self._IGNORED_DIRNAMES or super().is_ignored_dirname(dirname)
 
     def _is_next_ls_internal_file(self, abs_path: str) -> bool:
         """Check if an absolute path is a Next LS internal file that should be ignored."""
-        return any(
-            pattern in abs_path
-            for pattern in [
-                ".burrito",  # Next LS runtime directory
-                "next_ls_erts-",  # Next LS Erlang runtime
-                "_next_ls_private_",  # Next LS private files
-                "/priv/monkey/",  # Next LS monkey patching directory
-            ]
-        )
+        return any(pattern in abs_path for pattern in self._NEXT_LS_INTERNAL_PATH_PATTERNS)
 
     @override
     def _send_references_request(self, relative_file_path: str, line: int, column: int):
@@ -71,9 +76,26 @@ class ElixirTools(SolidLanguageServer):
 
     @classmethod
     def _get_elixir_version(cls):
-        """Get the installed Elixir version or None if not found."""
+        """
+        Get the installed Elixir version or None if not found.
+        Successful results are cached per executable path, since starting the BEAM VM just to query the version is slow;
+        failed probes are not cached, so that a transient failure does not persist for the lifetime of the process.
+        """
+        elixir_executable = shutil.which("elixir")
+        if elixir_executable is None:
+            return None
+        version = cls._elixir_version_cache.get(elixir_executable)
+        if version is None:
+            version = cls._probe_elixir_version(elixir_executable)
+            if version is not None:
+                cls._elixir_version_cache[elixir_executable] = version
+        return version
+
+    @staticmethod
+    def _probe_elixir_version(elixir_executable: str) -> str | None:
+        """Get the version of the given Elixir executable or None if it cannot be determined."""
         try:
-            result = subprocess.run(["elixir", "--version"], capture_output=True, text=True, check=False)
+            result = subprocess.run([elixir_executable, "--version"], capture_output=True, text=True, check=False)
             if result.returncode == 0:
                 return result.stdout.strip()
         except FileNotFoundError:
@@ -180,6 +202,7 @@ class ElixirTools(SolidLanguageServer):
         )
         self.server_ready = threading.Event()
         self.request_id = 0
+        self._init_activity_tracking()
 
         # Set generous timeout for Next LS which can be slow to initialize and respond
         self.set_request_timeout(180.0)  # 60 seconds for all environments
@@ -234,6 +257,8 @@ class ElixirTools(SolidLanguageServer):
                         },
                     },
                 },
+                # Next LS reports background compilation via work done progress, which is used to detect settling
+                "window": {"workDoneProgress": True},
                 "workspace": {
                     "workspaceFolders": True,
                     "didChangeConfiguration": {"dynamicRegistration": True},
@@ -245,6 +270,63 @@ class ElixirTools(SolidLanguageServer):
 
         return initialize_params
 
+    def _init_activity_tracking(self) -> None:
+        """Initializes the tracking of server activity (log/progress notifications) used to detect when background indexing has settled."""
+        self._last_activity_time = time.monotonic()
+        self._active_progress_tokens: set[str | int] = set()
+        self._activity_lock = threading.Lock()
+        self._progress_started_after_ready = False
+        # Set while all progress started after the readiness signal (background compilation) has ended;
+        # cleared again whenever new progress begins
+        self._background_work_done = False
+
+    def _record_progress(self, token: str | int | None, kind: str | None) -> None:
+        """Record a progress notification from Next LS, keeping track of work that is still in flight."""
+        with self._activity_lock:
+            self._last_activity_time = time.monotonic()
+            if token is None:
+                return
+            if kind == "begin":
+                self._active_progress_tokens.add(token)
+                self._background_work_done = False
+                if self.server_ready.is_set():
+                    self._progress_started_after_ready = True
+            elif kind == "end":
+                self._active_progress_tokens.discard(token)
+                if self._progress_started_after_ready and not self._active_progress_tokens:
+                    self._background_work_done = True
+
+    def _wait_for_settling(self, max_wait: float, quiet_window: float, progress_grace_period: float = 1.0) -> str | None:
+        """
+        Waits until Next LS has finished its background work, i.e. until either all progress started after the
+        readiness signal has ended (with no new activity for the given grace period, as further work may start right
+        after) or the server has had no progress in flight and has not sent any log or progress notifications for the
+        given quiet window.
+
+        :param max_wait: the maximum time, in seconds, to wait
+        :param quiet_window: the time, in seconds, without server activity after which the server is considered settled
+        :param progress_grace_period: the time, in seconds, without server activity after all post-ready progress has ended
+            after which the server is considered settled
+        :return: the reason for considering the server settled ("progress completed" or "quiet period"),
+            or None if max_wait elapsed first
+        """
+        deadline = time.monotonic() + max_wait
+        poll_interval = 0.05
+        while True:
+            now = time.monotonic()
+            with self._activity_lock:
+                idle_time = now - self._last_activity_time
+                is_progress_completed = self._background_work_done and idle_time > progress_grace_period
+                is_quiet = not self._active_progress_tokens and idle_time > quiet_window
+            if is_progress_completed:
+                return "progress completed"
+            if is_quiet:
+                return "quiet period"
+            if now >= deadline:
+                return None
+            time.sleep(min(poll_interval, deadline - now))
+            poll_interval = min(poll_interval * 2, 0.5)
+
     def _start_server(self):
         """Start Next LS server process"""
 
@@ -255,16 +337,22 @@ class ElixirTools(SolidLanguageServer):
             """Handle window/logMessage notifications from Next LS"""
             message_text = msg.get("message", "")
             self.logger.log(f"LSP: window/logMessage: {message_text}", logging.INFO)
+            with self._activity_lock:
+                self._last_activity_time = time.monotonic()
 
-            # Check for the specific Next LS readiness signal
+            # Check for the specific Next LS readiness signal (skipped once the server is ready)
             # Based on Next LS source: "Runtime for folder #{name} is ready..."
-            if "Runtime for folder" in message_text and "is ready..." in message_text:
+            if not self.server_ready.is_set() and "Runtime for folder" in message_text and "is ready..." in message_text:
                 self.logger.log("Next LS runtime is ready based on official log message", logging.INFO)
                 self.server_ready.set()
 
         def do_nothing(params):
             return
 
+        def work_done_progress_create(params):
+            """Acknowledge work done progress create requests, allowing Next LS to report progress on the token."""
+            return
+
         def check_server_ready(params):
             """
             Handle $/progress notifications from Next LS.
@@ -272,6 +360,7 @@ class ElixirTools(SolidLanguageServer):
             is now done via window/logMessage handler.
             """
             value = params.get("value", {})
+            self._record_progress(params.get("token"), value.get("kind"))
 
             # Check for initialization completion progress (fallback signal)
             if value.get("kind") == "end":
@@ -286,6 +375,7 @@ class ElixirTools(SolidLanguageServer):
             Keep for completeness but primary readiness detection is via window/logMessage.
             """
             value = params.get("value", {})
+            self._record_progress(params.get("token"), value.get("kind"))
             if value.get("kind") == "end":
                 self.logger.log("Next LS work done progress completed", logging.INFO)
                 # Note: We don't set server_ready here - we wait for the log message
@@ -293,7 +383,7 @@ class ElixirTools(SolidLanguageServer):
         self.server.on_request("client/registerCapability", register_capability_handler)
         self.server.on_notification("window/logMessage", window_log_message)
         self.server.on_notification("$/progress", check_server_ready)
-        self.server.on_notification("window/workDoneProgress/create", do_nothing)
+        self.server.on_request("window/workDoneProgress/create", work_done_progress_create)
         self.server.on_notification("$/workDoneProgress", work_done_progress)
         self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
 
@@ -330,12 +420,18 @@ class ElixirTools(SolidLanguageServer):
         if self.server_ready.wait(timeout=ready_timeout):
             self.logger.log("Next LS is ready and available for requests", logging.INFO)
 
-            # Add a small settling period to ensure background indexing is complete
-            # Next LS often continues compilation/indexing in background after ready signal
+            # Allow a settling period to ensure background indexing is complete, since Next LS often
+            # continues compilation/indexing in background after the ready signal.
+            # Instead of sleeping for the full period, we stop as soon as the server has gone quiet.
             settling_time = 120.0
-            self.logger.log(f"Allowing {settling_time} seconds for Next LS background indexing to complete...", logging.INFO)
-            time.sleep(settling_time)
-            self.logger.log("Next LS settling period complete", logging.INFO)
+            quiet_window = 5.0
+            self.logger.log(f"Allowing up to {settling_time} seconds for Next LS background indexing to complete...", logging.INFO)
+            settling_start = time.monotonic()
+            settling_reason = self._wait_for_settling(settling_time, quiet_window)
+            if settling_reason is not None:
+                self.logger.log(f"Next LS settled after {time.monotonic() - settling_start:.1f} seconds ({settling_reason})", logging.INFO)
+            else:
+                self.logger.log("Next LS settling period complete", logging.INFO)
         else:
             error_msg = f"Next LS failed to initialize within {ready_timeout} seconds. This may indicate a problem with the Elixir installation, project compilation, or Next LS itself."
             self.logger.log(error_msg, logging.ERROR)
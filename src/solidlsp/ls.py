@@ -8,6 +8,7 @@ import pickle
 import shutil
 import subprocess
 import threading
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Iterator
@@ -17,6 +18,7 @@ from pathlib import Path, PurePath
 from typing import Self, Union, cast
 
 import pathspec
+import psutil
 
 from serena.text_utils import MatchedConsecutiveLines
 from serena.util.file_system import match_path
@@ -371,10 +373,14 @@ class SolidLanguageServer(ABC):
 
         return match_path(relative_path, self.get_ignore_spec(), root_path=self.repository_root_path)
 
-    def _shutdown(self, timeout: float = 5.0):
+    def _shutdown(self, timeout: float = 5.0, child_process_timeout: float = 2.0):
         """
         A robust shutdown process designed to terminate cleanly on all platforms, including Windows,
         by explicitly closing all I/O pipes.
+
+        :param timeout: the time, in seconds, to wait for the server process to exit after terminating it
+        :param child_process_timeout: the time, in seconds, to wait for descendant processes of the server process
+            to exit after terminating them, before killing them
         """
         if not self.server.is_running():
             self.logger.log("Server process not running, skipping shutdown.", logging.DEBUG)
@@ -407,7 +413,15 @@ class SolidLanguageServer(ABC):
             # Ignore errors here, we are proceeding to terminate anyway.
 
         # Stage 2: Terminate and Wait for Process to Exit
+        # The server is launched via a shell, so terminating only the direct child can leave the actual language server
+        # running. Collect its descendants before terminating, since they are reparented once the shell exits.
+        child_processes = self._get_child_processes(process.pid)
         self.logger.log(f"Terminating process {process.pid}, current status: {process.poll()}", logging.DEBUG)
+        for child in child_processes:
+            try:
+                child.terminate()
+            except psutil.Error:
+                pass
         process.terminate()
 
         # Stage 3: Wait for process termination with timeout
@@ -427,6 +441,60 @@ class SolidLanguageServer(ABC):
         except Exception as e:
             self.logger.log(f"Error during process shutdown: {e}", logging.ERROR)
 
+        # Stage 4: Make sure no descendant processes survive
+        if child_processes:
+            alive = self._wait_for_processes_to_exit(child_processes, timeout=child_process_timeout)
+            for child in alive:
+                self.logger.log(f"Child process {child.pid} did not terminate, killing it forcefully...", logging.WARNING)
+                try:
+                    child.kill()
+                except psutil.Error:
+                    pass
+            still_alive = self._wait_for_processes_to_exit(alive, timeout=1.0)
+            for child in still_alive:
+                self.logger.log(f"Child process {child.pid} could not be killed within timeout.", logging.ERROR)
+
+    @staticmethod
+    def _wait_for_processes_to_exit(processes: list[psutil.Process], timeout: float) -> list[psutil.Process]:
+        """
+        Waits for the given processes to exit, returning as soon as all of them have.
+        Zombie processes are considered to have exited, since descendants reparented to an init process
+        that does not reap them (e.g. in containers) would otherwise always appear to be running.
+
+        psutil.wait_procs cannot be used for this: it does not treat zombies as exited and would therefore
+        always wait for the full timeout in such environments. It also cannot avoid polling here, since the
+        descendants are not children of this process and thus cannot be waited for via waitpid, so psutil
+        polls their status internally as well.
+
+        :param processes: the processes to wait for
+        :param timeout: the maximum time, in seconds, to wait
+        :return: the processes that are still running after the timeout
+        """
+
+        def is_alive(p: psutil.Process) -> bool:
+            try:
+                return p.is_running() and p.status() != psutil.STATUS_ZOMBIE
+            except psutil.Error:
+                return False
+
+        deadline = time.monotonic() + timeout
+        alive = [p for p in processes if is_alive(p)]
+        while alive and time.monotonic() < deadline:
+            time.sleep(0.05)
+            alive = [p for p in alive if is_alive(p)]
+        return alive
+
+    @staticmethod
+    def _get_child_processes(pid: int) -> list[psutil.Process]:
+        """
+        :param pid: the id of the parent process
+        :return: all (recursive) child processes of the given process; empty if they cannot be determined
+        """
+        try:
+            return psutil.Process(pid).children(recursive=True)
+        except psutil.Error:
+            return []
+
     @contextmanager
     def start_server(self) -> Iterator["SolidLanguageServer"]:
         self.start()
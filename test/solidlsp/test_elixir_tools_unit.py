@@ -0,0 +1,112 @@
+"""
+Unit tests for ElixirTools helpers that do not require a running Next LS.
+"""
+
+import subprocess
+import threading
+from collections.abc import Callable
+from unittest import mock
+
+import pytest
+
+from solidlsp.language_servers.elixir_tools import elixir_tools
+from solidlsp.language_servers.elixir_tools.elixir_tools import ElixirTools
+
+
+@pytest.fixture
+def fake_elixir(monkeypatch):
+    """Resolves `elixir` to a fake executable path and starts with an empty version cache."""
+    monkeypatch.setattr(ElixirTools, "_elixir_version_cache", {})
+    monkeypatch.setattr(elixir_tools.shutil, "which", lambda name: "/fake/bin/elixir")
+
+
+def test_elixir_version_probe_is_cached(fake_elixir):
+    completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="Elixir 1.15.7\n")
+    with mock.patch.object(elixir_tools.subprocess, "run", return_value=completed) as run:
+        assert ElixirTools._get_elixir_version() == "Elixir 1.15.7"
+        assert ElixirTools._get_elixir_version() == "Elixir 1.15.7"
+    run.assert_called_once()
+
+
+def test_failed_elixir_version_probe_is_not_cached(fake_elixir):
+    failed = subprocess.CompletedProcess(args=[], returncode=1, stdout="")
+    completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="Elixir 1.15.7\n")
+    with mock.patch.object(elixir_tools.subprocess, "run", side_effect=[failed, completed]) as run:
+        assert ElixirTools._get_elixir_version() is None
+        assert ElixirTools._get_elixir_version() == "Elixir 1.15.7"
+    assert run.call_count == 2
+
+
+class FakeClock:
+    """Replaces `time` in the elixir_tools module, advancing time on sleep and firing scheduled callbacks at their exact time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._scheduled: list[tuple[float, Callable[[], None]]] = []
+
+    def schedule(self, at: float, callback: Callable[[], None]) -> None:
+        self._scheduled.append((at, callback))
+        self._scheduled.sort(key=lambda item: item[0])
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        target = self.now + seconds
+        while self._scheduled and self._scheduled[0][0] <= target:
+            at, callback = self._scheduled.pop(0)
+            self.now = at
+            callback()
+        self.now = target
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(elixir_tools, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def ready_ls(fake_clock) -> ElixirTools:
+    """An ElixirTools instance with activity tracking set up and the readiness signal received, without a running server."""
+    ls = ElixirTools.__new__(ElixirTools)
+    ls.server_ready = threading.Event()
+    ls._init_activity_tracking()
+    ls.server_ready.set()
+    return ls
+
+
+def test_settling_waits_for_progress_started_after_completion(ready_ls, fake_clock):
+    """Settling must not end when post-ready progress drains if further progress begins shortly afterwards."""
+    # compile runs from 0.0s to 0.1s, indexing starts at 0.3s and ends at 1.3s
+    ready_ls._record_progress("compile", "begin")
+    fake_clock.schedule(0.1, lambda: ready_ls._record_progress("compile", "end"))
+    fake_clock.schedule(0.3, lambda: ready_ls._record_progress("index", "begin"))
+    fake_clock.schedule(1.3, lambda: ready_ls._record_progress("index", "end"))
+
+    reason = ready_ls._wait_for_settling(max_wait=10.0, quiet_window=5.0, progress_grace_period=0.5)
+
+    assert reason == "progress completed"
+    assert fake_clock.now > 1.3 + 0.5
+    assert fake_clock.now < 5.0
+
+
+def test_settling_ends_after_quiet_period(ready_ls, fake_clock):
+    """Without post-ready progress, settling ends once no notifications have arrived for the quiet window."""
+    fake_clock.schedule(1.0, lambda: ready_ls._record_progress(None, None))  # e.g. a log message
+
+    reason = ready_ls._wait_for_settling(max_wait=120.0, quiet_window=5.0)
+
+    assert reason == "quiet period"
+    assert 1.0 + 5.0 < fake_clock.now < 1.0 + 5.0 + 0.5
+
+
+def test_settling_does_not_end_while_progress_is_in_flight(ready_ls, fake_clock):
+    """Progress that never ends keeps the server from being considered quiet, so the wait ends at max_wait."""
+    ready_ls._record_progress("compile", "begin")
+
+    reason = ready_ls._wait_for_settling(max_wait=20.0, quiet_window=5.0)
+
+    assert reason is None
+    assert fake_clock.now == pytest.approx(20.0)
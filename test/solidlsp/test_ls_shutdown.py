@@ -0,0 +1,80 @@
+"""
+Tests for the process termination in SolidLanguageServer._shutdown, using a shell process tree in place of a language server.
+"""
+
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import psutil
+import pytest
+
+from solidlsp.ls import SolidLanguageServer
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="uses POSIX shell process trees")
+
+
+class _ShutdownOnlyLanguageServer(SolidLanguageServer):
+    """Exposes _shutdown for a plain process, without launching an actual language server."""
+
+    def __init__(self, process: subprocess.Popen):
+        self.server = SimpleNamespace(is_running=lambda: process.returncode is None, process=process, shutdown=lambda: None)
+        self.logger = SimpleNamespace(log=lambda message, level: None)
+
+    def _start_server(self):
+        raise NotImplementedError
+
+
+def _start_process_tree(shell_script: str) -> tuple[subprocess.Popen, list[psutil.Process]]:
+    """Starts the given script via a shell (as language servers are started) and returns the process and its two descendants."""
+    process = subprocess.Popen(shell_script, shell=True, stdin=subprocess.PIPE)
+    deadline = time.monotonic() + 5.0
+    children: list[psutil.Process] = []
+    while len(children) < 2 and time.monotonic() < deadline:
+        time.sleep(0.05)
+        children = psutil.Process(process.pid).children(recursive=True)
+    assert len(children) == 2, f"Expected two descendant processes, got {children}"
+    return process, children
+
+
+def _is_alive(p: psutil.Process) -> bool:
+    try:
+        return p.is_running() and p.status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        return False
+
+
+def test_shutdown_terminates_descendant_processes():
+    process, children = _start_process_tree("sleep 60 & sleep 60; wait")
+
+    start = time.monotonic()
+    _ShutdownOnlyLanguageServer(process)._shutdown(timeout=5.0)
+
+    assert process.returncode is not None
+    assert not any(_is_alive(child) for child in children)
+    assert time.monotonic() - start < 2.0
+
+
+def test_shutdown_kills_descendant_processes_ignoring_terminate():
+    process, children = _start_process_tree("trap '' TERM; sleep 60 & sleep 60; wait")
+
+    _ShutdownOnlyLanguageServer(process)._shutdown(timeout=0.5, child_process_timeout=0.2)
+
+    assert process.returncode is not None
+    assert not any(_is_alive(child) for child in children)
+
+
+def test_wait_for_processes_to_exit_returns_remaining_processes():
+    process, children = _start_process_tree("sleep 60 & sleep 60; wait")
+    try:
+        children[0].terminate()
+        alive = SolidLanguageServer._wait_for_processes_to_exit(children, timeout=0.3)
+        assert alive == [children[1]]
+    finally:
+        for p in [*children, psutil.Process(process.pid)]:
+            try:
+                p.kill()
+            except psutil.Error:
+                pass
+        process.wait()